@@ -1,12 +1,20 @@
-import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, pooling
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Mapping, Optional, Tuple, TextIO
 import re
 from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import configparser
+import functools
+import locale
+import logging
+import subprocess
 import sys
+import tempfile
+import threading
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
 
 @dataclass
@@ -20,7 +28,7 @@ class ColumnInfo:
     numeric_precision: Optional[int]
     numeric_scale: Optional[int]
 
-@dataclass
+@dataclass(frozen=True)
 class AttributeConfig:
     use_key: bool = True
     use_required: bool = True
@@ -29,288 +37,602 @@ class AttributeConfig:
     use_table: bool = True
     use_database_generated: bool = True
 
+# MySQL to C# type mapping for non-nullable columns
+TYPE_MAPPING = {
+    'bit': 'bool',
+    'tinyint': 'byte',
+    'smallint': 'short',
+    'int': 'int',
+    'bigint': 'long',
+    'decimal': 'decimal',
+    'float': 'float',
+    'double': 'double',
+    'datetime': 'DateTime',
+    'date': 'DateTime',
+    'timestamp': 'DateTime',
+    'time': 'TimeSpan',
+    'char': 'string',
+    'varchar': 'string',
+    'text': 'string',
+    'longtext': 'string',
+    'json': 'string'
+}
+
+# Same mapping for nullable columns; value types get the '?' suffix
+NULLABLE_TYPE_MAPPING = {
+    mysql_type: cs_type if cs_type == 'string' else f"{cs_type}?"
+    for mysql_type, cs_type in TYPE_MAPPING.items()
+}
+
+# Fixed fragments of generated C# classes
+KEY_ATTRIBUTE = "        [Key]\n"
+DATABASE_GENERATED_ATTRIBUTE = "        [DatabaseGenerated(DatabaseGeneratedOption.Identity)]\n"
+REQUIRED_ATTRIBUTE = "        [Required]\n"
+PROPERTY_TEMPLATE = "{attributes}        public {type} {name} {{ get; set; }}\n\n"
+CLASS_TEMPLATE = (
+    "{usings}\n"
+    "{namespace}\n"
+    "{table_attribute}"
+    "    public class {name}\n"
+    "    {{\n"
+    "{properties}"
+    "    }}\n"
+    "}}"
+)
+MAXLENGTH_TYPES = ('varchar', 'char')
+
+# Display width of tinyint columns, e.g. "tinyint(1)"
+TINYINT_LENGTH_RE = re.compile(r'tinyint\((\d+)\)')
+
+# First line of a CREATE TABLE statement in mysqldump output
+CREATE_TABLE_START_RE = re.compile(r'^CREATE TABLE `((?:[^`]|``)+)` ')
+
+# Line mysqldump writes after every CREATE TABLE statement. A statement may
+# contain lines ending in ';' (e.g. in comments), so it is only complete once
+# this line follows. Tables without it fall back to SHOW CREATE TABLE.
+CREATE_TABLE_END_LINE = "/*!40101 SET character_set_client = @saved_cs_client */;"
+
+# Seconds to wait for mysqldump before falling back to SHOW CREATE TABLE
+MYSQLDUMP_TIMEOUT = 60
+
+# Rows requested per fetch on the metadata cursor
+CURSOR_ARRAYSIZE = 10000
+
+# Connections kept open for reuse across generate_entities runs
+CONNECTION_POOL_SIZE = 1
+
+# Session settings written at the top of the SQL script
+SQL_HEADER_SETTINGS = (
+    "SET FOREIGN_KEY_CHECKS=0;\n"
+    "SET SQL_MODE = 'NO_AUTO_VALUE_ON_ZERO';\n"
+    "SET NAMES utf8mb4;\n"
+    "\n"
+)
+
+# Write buffer for the streamed SQL script
+SQL_WRITE_BUFFER_SIZE = 1 << 20
+
+# Threads used to write generated class files
+FILE_WRITE_WORKERS = 8
+
+# Encoding of the configuration file, read and written alike. The locale
+# encoding matches what configparser used for existing files.
+CONFIG_ENCODING = locale.getpreferredencoding(False)
+
 class ConfigurationError(Exception):
     """Custom exception for configuration errors"""
     pass
 
-# ... (previous imports remain the same)
+class ConfigSection(Mapping):
+    """Read-only configuration section with configparser-style typed getters
+    
+    Sections are shared between instances through the configuration cache,
+    so they cannot be modified.
+    """
+    _BOOLEAN_STATES = {'1': True, 'yes': True, 'true': True, 'on': True,
+                       '0': False, 'no': False, 'false': False, 'off': False}
+
+    def __init__(self, options: Optional[Dict[str, str]] = None):
+        self._options = dict(options or {})
+
+    def __getitem__(self, option: str) -> str:
+        return self._options[option]
+
+    def __iter__(self):
+        return iter(self._options)
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._options!r})"
+
+    def getboolean(self, option: str, fallback: Optional[bool] = None) -> Optional[bool]:
+        """Return option as a boolean, or fallback if it is not set"""
+        if option not in self:
+            return fallback
+        value = self[option].lower()
+        if value not in self._BOOLEAN_STATES:
+            raise ConfigurationError(f"Not a boolean value for {option}: {self[option]}")
+        return self._BOOLEAN_STATES[value]
+
+class FastConfigParser:
+    """Minimal INI reader that returns plain dictionaries of sections
+    
+    Follows configparser's defaults where they matter for this tool: '=' or
+    ':' delimiters, full-line '#'/';' comments, lower-cased option names and
+    [DEFAULT] values applying to every section. Anything it cannot represent
+    (multi-line values, duplicates, malformed lines) is a ConfigurationError
+    rather than being skipped.
+    """
+    _SECTION = re.compile(r'^\[(.+)\]$')
+    _KV = re.compile(r'^([^=:]+?)\s*[=:]\s*(.*)$')
+
+    @classmethod
+    def read(cls, file_path: str) -> Dict[str, ConfigSection]:
+        """Parse an INI file written in CONFIG_ENCODING"""
+        try:
+            with open(file_path, encoding=CONFIG_ENCODING) as f:
+                text = f.read()
+        except UnicodeDecodeError as e:
+            raise ConfigurationError(
+                f"Cannot read configuration file {file_path} as {CONFIG_ENCODING}: {e}") from e
+        return cls.read_string(text)
+
+    @classmethod
+    def read_string(cls, text: str) -> Dict[str, ConfigSection]:
+        """Parse INI content; option names are lower-cased like configparser"""
+        sections = {}
+        current = None
+        option = None
+        for line_number, line in enumerate(text.splitlines(), 1):
+            stripped = line.strip()
+            if not stripped or stripped[0] in '#;':
+                continue
+            
+            if line[0].isspace() and option is not None:
+                raise ConfigurationError(
+                    f"Line {line_number}: multi-line values are not supported: {stripped}")
+            
+            match = cls._SECTION.match(stripped)
+            if match:
+                name = match.group(1)
+                if name in sections:
+                    raise ConfigurationError(f"Line {line_number}: duplicate section: {name}")
+                current = sections[name] = {}
+                option = None
+                continue
+            
+            match = cls._KV.match(stripped)
+            if not match:
+                raise ConfigurationError(
+                    f"Line {line_number}: expected '[section]' or 'option = value': {stripped}")
+            if current is None:
+                raise ConfigurationError(f"Line {line_number}: option outside of a section: {stripped}")
+            option = match.group(1).lower()
+            if option in current:
+                raise ConfigurationError(f"Line {line_number}: duplicate option: {option}")
+            current[option] = cls._unescape(option, match.group(2))
+        
+        # Like configparser, [DEFAULT] supplies fallbacks for every section
+        defaults = sections.pop('DEFAULT', {})
+        return {name: ConfigSection({**defaults, **options}) for name, options in sections.items()}
+
+    @staticmethod
+    def _unescape(option: str, value: str) -> str:
+        """Turn '%%' into '%', as configparser's default interpolation does
+        
+        Any other '%' is rejected, matching configparser, instead of being
+        passed through with a different meaning.
+        """
+        if '%' not in value:
+            return value
+        if '%' in value.replace('%%', ''):
+            raise ConfigurationError(
+                f"Invalid '%' in value for {option}: use '%%' for a literal '%'")
+        return value.replace('%%', '%')
+
+@functools.lru_cache(maxsize=8)
+def _load_configuration(config_file: str, mtime_ns: int) -> Mapping[str, ConfigSection]:
+    """Load and validate configuration from INI file, cached per path and modification time"""
+    config = FastConfigParser.read(config_file)
+    
+    # Validate required sections
+    required_sections = ['Database', 'Generator']
+    for section in required_sections:
+        if section not in config:
+            raise ConfigurationError(f"Missing required section: {section}")
+    
+    # Validate Database section
+    required_db_params = ['host', 'database', 'user', 'password']
+    for param in required_db_params:
+        if param not in config['Database']:
+            raise ConfigurationError(f"Missing required database parameter: {param}")
+    
+    # Validate Generator section
+    required_gen_params = ['output_directory', 'namespace']
+    for param in required_gen_params:
+        if param not in config['Generator']:
+            raise ConfigurationError(f"Missing required generator parameter: {param}")
+    
+    # The result is shared by every caller with the same file, so hand out a read-only view
+    return MappingProxyType(config)
+
+@functools.lru_cache(maxsize=8)
+def _load_attribute_config(config_file: str, mtime_ns: int) -> AttributeConfig:
+    """Load attribute configuration with defaults"""
+    config = _load_configuration(config_file, mtime_ns)
+    attr_config = config['Attributes'] if 'Attributes' in config else ConfigSection()
+    
+    return AttributeConfig(
+        use_key=attr_config.getboolean('use_key_attribute', True),
+        use_required=attr_config.getboolean('use_required_attribute', True),
+        use_column=attr_config.getboolean('use_column_attribute', True),
+        use_maxlength=attr_config.getboolean('use_maxlength_attribute', True),
+        use_table=attr_config.getboolean('use_table_attribute', True),
+        use_database_generated=attr_config.getboolean('use_databasegenerated_attribute', True)
+    )
+
+@functools.lru_cache(maxsize=8)
+def _build_usings_header(need_data_annotations: bool, need_schema: bool) -> str:
+    """Build the using statements block for generated classes"""
+    using_statements = ["using System;"]
+    
+    if need_data_annotations:
+        using_statements.append("using System.ComponentModel.DataAnnotations;")
+    
+    if need_schema:
+        using_statements.append("using System.ComponentModel.DataAnnotations.Schema;")
+    
+    # Trailing newline leaves a blank line before the namespace
+    return "\n".join(sorted(using_statements)) + "\n"
 
 class EntityGenerator:
     def __init__(self, config_file: str):
-        self.config = self._load_configuration(config_file)
+        if not os.path.exists(config_file):
+            raise ConfigurationError(f"Configuration file not found: {config_file}")
+        
+        # Parsed configuration and derived state are shared between instances
+        # until the file changes
+        mtime_ns = os.stat(config_file).st_mtime_ns
+        self.config = _load_configuration(config_file, mtime_ns)
+        self._db_name = self.config['Database']['database']
         self.output_dir = self.config['Generator']['output_directory']
-        self.attribute_config = self._load_attribute_config()
+        # Output paths are built by prefixing file names in the per-table loop
+        self._output_prefix = self.output_dir.rstrip(os.sep + (os.altsep or '')) + os.sep
+        self.attribute_config = _load_attribute_config(config_file, mtime_ns)
         self.verbose = self.config['Generator'].getboolean('verbose', True)
+        # Progress messages are INFO records on the shared 'entitygen' logger,
+        # whose level is left to the caller. A quiet generator binds a no-op
+        # instead, so its messages are never formatted.
+        self._log = logging.getLogger('entitygen')
+        self._info = self._log.info if self.verbose else _discard_log
         self.generate_sql = self.config['Generator'].getboolean('generate_sql', False)
         self.sql_output_file = self.config['Generator'].get('sql_output_file', 'database_structure.sql')
         
+        # Connection pool, created on the first call to get_connection
+        self._pool = None
+        
+        # Namespaces required by the enabled attributes
+        attribute_config = self.attribute_config
+        self._need_dataannot = (attribute_config.use_key or attribute_config.use_required
+                                or attribute_config.use_maxlength)
+        self._need_schema = (attribute_config.use_column or attribute_config.use_table
+                             or attribute_config.use_database_generated)
+        self._usings_header = _build_usings_header(self._need_dataannot, self._need_schema)
+        self._ns_open = f"namespace {self.config['Generator']['namespace']}\n{{"
+        
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
-        self.log("Initialized generator with configuration from: " + config_file)
-    
-    def log(self, message: str):
-        """Print message if verbose mode is enabled"""
-        if self.verbose:
-            print(message)
-
-    async def generate_sql_script(self, cursor) -> str:
-        """Generate SQL creation script for all tables"""
-        self.log("Generating SQL creation script...")
-        
-        tables = await self.get_tables(cursor)
-        script_parts = []
+        self._info("Initialized generator with configuration from: %s", config_file)
+
+    def _write_sql_script(self, cursor, tables: List[str], f: TextIO):
+        """Write SQL creation script for the given tables to an open file"""
+        self._info("Generating SQL creation script...")
         
-        # Add header
-        script_parts.extend([
-            "-- Database structure script",
-            f"-- Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"-- Database: {self.config['Database']['database']}",
-            "",
-            "SET FOREIGN_KEY_CHECKS=0;",
-            "SET SQL_MODE = 'NO_AUTO_VALUE_ON_ZERO';",
-            "SET NAMES utf8mb4;",
-            ""
-        ])
-
-        for table in tables:
-            self.log(f"Getting structure for table: {table}")
-            
-            # Get table creation SQL
-            cursor.execute(f"SHOW CREATE TABLE `{table}`")
-            create_table_sql = cursor.fetchone()[1]
-            
-            # Add to script
-            script_parts.extend([
-                f"-- Table structure for table `{table}`",
-                "DROP TABLE IF EXISTS `" + table + "`;",
-                create_table_sql + ";",
-                ""
-            ])
-
-        script_parts.append("SET FOREIGN_KEY_CHECKS=1;")
+        # Write header; only the timestamp changes between runs
+        f.write(
+            "-- Database structure script\n"
+            f"-- Generated on {datetime.now():%Y-%m-%d %H:%M:%S}\n"
+            f"-- Database: {self._db_name}\n"
+            "\n"
+            f"{SQL_HEADER_SETTINGS}"
+        )
+
+        # Statements from mysqldump are written as soon as each one is complete,
+        # so neither the dump nor the script is ever held in memory. Tables the
+        # dump did not provide are then fetched one at a time.
+        pending = dict.fromkeys(tables)
+        for table, create_table_sql in self._dump_schema():
+            if table in pending:
+                del pending[table]
+                self._info("Getting structure for table: %s", table)
+                self._write_table_structure(f, table, create_table_sql)
         
-        return "\n".join(script_parts)
+        for table in pending:
+            self._info("Getting structure for table: %s", table)
+            # Identifiers cannot be bound as parameters, so quote the name
+            cursor.execute(f"SHOW CREATE TABLE {quote_identifier(table)}")
+            self._write_table_structure(f, table, cursor.fetchone()[1])
+
+        f.write("SET FOREIGN_KEY_CHECKS=1;")
+
+    def _write_table_structure(self, f: TextIO, table: str, create_table_sql: str):
+        """Write the DROP and CREATE statements for one table"""
+        quoted_table = quote_identifier(table)
+        f.write(
+            f"-- Table structure for table {quoted_table}\n"
+            f"DROP TABLE IF EXISTS {quoted_table};\n"
+            f"{create_table_sql};\n"
+            "\n"
+        )
 
-    async def generate_entities(self):
+    def _dump_schema(self) -> Iterator[Tuple[str, str]]:
+        """Yield (table, CREATE TABLE statement) pairs from a single mysqldump run
+        
+        Statements are parsed from the pipe and yielded as soon as each is
+        complete. If mysqldump is not installed, fails, times out or emits
+        undecodable output, the remaining tables are simply not yielded and
+        the caller falls back to SHOW CREATE TABLE for them.
+        """
+        db_config = self.config['Database']
+        command = [
+            'mysqldump',
+            # Ignore option files (must come first) and use TCP, so the dump
+            # reaches the same server with the same credentials as mysql.connector
+            '--no-defaults',
+            '--protocol=TCP',
+            '-h', db_config['host'],
+            '-u', db_config['user'],
+            '--no-data',
+            '--skip-comments',
+            '--skip-add-drop-table',
+            '--skip-triggers',
+            # --opt would LOCK TABLES ... READ every table just to read DDL
+            '--skip-lock-tables',
+            # Dumping tablespaces needs the PROCESS privilege from MySQL 8.0.21
+            '--no-tablespaces',
+            self._db_name
+        ]
+        # Pass the password via the environment to keep it off the command line
+        env = dict(os.environ, MYSQL_PWD=db_config['password'])
+        
+        # stderr goes to a file so a chatty dump cannot fill a second pipe and stall
+        stderr_file = tempfile.TemporaryFile()
+        try:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_file, env=env)
+        except FileNotFoundError:
+            stderr_file.close()
+            self._info("mysqldump not found, using SHOW CREATE TABLE instead")
+            return
+        
+        # Kill a dump that blocks, e.g. on a metadata lock, instead of hanging
+        timed_out = threading.Event()
+        def kill():
+            timed_out.set()
+            process.kill()
+        watchdog = threading.Timer(MYSQLDUMP_TIMEOUT, kill)
+        watchdog.start()
+        
+        try:
+            table = None
+            statement = None
+            for raw_line in process.stdout:
+                try:
+                    line = raw_line.decode('utf-8').rstrip('\r\n')
+                except UnicodeDecodeError as e:
+                    self._log.warning("Cannot decode mysqldump output, using SHOW CREATE TABLE instead: %s", e)
+                    return
+                
+                match = CREATE_TABLE_START_RE.match(line)
+                if match:
+                    table = match.group(1).replace('``', '`')
+                    statement = [line]
+                elif statement is not None:
+                    if line == CREATE_TABLE_END_LINE and statement[-1].endswith(';'):
+                        yield table, "\n".join(statement)[:-1]
+                        statement = None
+                    else:
+                        statement.append(line)
+            
+            process.wait()
+            if timed_out.is_set():
+                self._log.warning("mysqldump timed out, using SHOW CREATE TABLE instead")
+            elif process.returncode != 0:
+                stderr_file.seek(0)
+                error = stderr_file.read().decode('utf-8', errors='replace').strip()
+                self._log.warning("mysqldump failed, using SHOW CREATE TABLE instead: %s", error)
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+            process.stdout.close()
+            stderr_file.close()
+    
+    def generate_entities(self):
         """Main method to generate all entity classes"""
         try:
-            self.log("Connecting to database...")
+            self._info("Connecting to database...")
             conn = self.get_connection()
-            self.log(f"Successfully connected to database: {self.config['Database']['database']}")
+            self._info("Successfully connected to database: %s", self._db_name)
             
-            cursor = conn.cursor()
+            # Buffered cursor so each result set is drained in a single fetch
+            cursor = conn.cursor(buffered=True)
+            cursor.arraysize = CURSOR_ARRAYSIZE
             
             # Get all tables
-            tables = await self.get_tables(cursor)
-            self.log(f"Found {len(tables)} tables in database")
+            tables = self.get_tables(cursor)
+            self._info("Found %d tables in database", len(tables))
             
             # Generate SQL script if requested
             if self.generate_sql:
-                self.log("Generating SQL script...")
-                sql_script = await self.generate_sql_script(cursor)
-                sql_file_path = os.path.join(self.output_dir, self.sql_output_file)
+                self._info("Generating SQL script...")
+                sql_file_path = f"{self._output_prefix}{self.sql_output_file}"
                 
-                with open(sql_file_path, 'w', encoding='utf-8') as f:
-                    f.write(sql_script)
-                self.log(f"SQL script generated: {sql_file_path}")
+                # Stream into a temporary file next to the target and move it
+                # into place only once complete, so a failure partway through
+                # leaves any previous script untouched
+                tmp_file_path = f"{sql_file_path}.{os.getpid()}.tmp"
+                try:
+                    with open(tmp_file_path, 'w', encoding='utf-8', buffering=SQL_WRITE_BUFFER_SIZE) as f:
+                        self._write_sql_script(cursor, tables, f)
+                    os.replace(tmp_file_path, sql_file_path)
+                except BaseException:
+                    if os.path.exists(tmp_file_path):
+                        os.remove(tmp_file_path)
+                    raise
+                self._info("SQL script generated: %s", sql_file_path)
+            
+            # Get columns for all tables in one round trip
+            columns_by_table = self.get_all_columns(cursor)
             
             # Generate class for each table
+            outputs = []
             for table in tables:
-                self.log(f"Processing table: {table}")
+                self._info("Processing table: %s", table)
                 
-                # Get columns for this table
-                columns = await self.get_columns(cursor, table)
-                self.log(f"Found {len(columns)} columns in table {table}")
+                columns = columns_by_table.get(table, [])
+                self._info("Found %d columns in table %s", len(columns), table)
                 
                 # Generate class content
                 class_content = self.generate_class(table, columns)
                 
-                # Write to file
                 file_name = f"{self.to_pascal_case(table)}.cs"
-                file_path = os.path.join(self.output_dir, file_name)
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(class_content)
-                
-                self.log(f"Generated entity class: {file_name}")
+                file_path = f"{self._output_prefix}{file_name}"
+                outputs.append((file_path, class_content))
             
-            self.log("\nEntity generation completed successfully!")
+            # Write files in parallel so the file system calls overlap
+            with ThreadPoolExecutor(max_workers=FILE_WRITE_WORKERS) as executor:
+                for file_path in executor.map(write_text_file, outputs):
+                    self._info("Generated entity class: %s", os.path.basename(file_path))
+            
+            self._info("\nEntity generation completed successfully!")
             
         except Error as e:
-            self.log(f"Database error: {e}")
+            self._info("Database error: %s", e)
             raise
         except Exception as e:
-            self.log(f"Error: {e}")
+            self._info("Error: %s", e)
             raise
         finally:
             if 'conn' in locals():
                 cursor.close()
                 conn.close()
-                self.log("Database connection closed")
+                self._info("Database connection closed")
 
     def get_connection(self):
-        """Create database connection using configuration"""
+        """Get a database connection from the pool, creating the pool on first use"""
         try:
-            conn = mysql.connector.connect(
-                host=self.config['Database']['host'],
-                database=self.config['Database']['database'],
-                user=self.config['Database']['user'],
-                password=self.config['Database']['password']
-            )
-            return conn
+            if self._pool is None:
+                self._pool = pooling.MySQLConnectionPool(
+                    pool_name='entitygen',
+                    pool_size=CONNECTION_POOL_SIZE,
+                    host=self.config['Database']['host'],
+                    database=self._db_name,
+                    user=self.config['Database']['user'],
+                    password=self.config['Database']['password'],
+                    use_pure=False,  # Prefer the C extension when it is installed
+                    consume_results=True,
+                    autocommit=True,
+                    raise_on_warnings=False
+                )
+            return self._pool.get_connection()
         except Error as e:
-            self.log(f"Failed to connect to database: {e}")
+            self._info("Failed to connect to database: %s", e)
             raise
     
-    def _load_attribute_config(self) -> AttributeConfig:
-        """Load attribute configuration with defaults"""
-        attr_config = self.config['Attributes'] if 'Attributes' in self.config else {}
-        
-        return AttributeConfig(
-            use_key=attr_config.getboolean('use_key_attribute', True),
-            use_required=attr_config.getboolean('use_required_attribute', True),
-            use_column=attr_config.getboolean('use_column_attribute', True),
-            use_maxlength=attr_config.getboolean('use_maxlength_attribute', True),
-            use_table=attr_config.getboolean('use_table_attribute', True),
-            use_database_generated=attr_config.getboolean('use_databasegenerated_attribute', True)
-        )
-    
-    def _load_configuration(self, config_file: str) -> configparser.ConfigParser:
-        """Load and validate configuration from INI file"""
-        if not os.path.exists(config_file):
-            raise ConfigurationError(f"Configuration file not found: {config_file}")
-        
-        config = configparser.ConfigParser()
-        config.read(config_file)
-        
-        # Validate required sections
-        required_sections = ['Database', 'Generator']
-        for section in required_sections:
-            if section not in config:
-                raise ConfigurationError(f"Missing required section: {section}")
-        
-        # Validate Database section
-        required_db_params = ['host', 'database', 'user', 'password']
-        for param in required_db_params:
-            if param not in config['Database']:
-                raise ConfigurationError(f"Missing required database parameter: {param}")
-        
-        # Validate Generator section
-        required_gen_params = ['output_directory', 'namespace']
-        for param in required_gen_params:
-            if param not in config['Generator']:
-                raise ConfigurationError(f"Missing required generator parameter: {param}")
-        
-        return config
-
     def generate_class(self, table_name: str, columns: List[ColumnInfo]) -> str:
         """Generate C# class content"""
-        class_name = self.to_pascal_case(table_name)
+        # Add table attribute if configured
+        table_attribute = f'    [Table("{table_name}")]\n' if self.attribute_config.use_table else ""
         
-        # Collect necessary using statements
-        using_statements = set(["using System;"])
+        # Render each property in a single format call
+        properties = [
+            PROPERTY_TEMPLATE.format(
+                attributes=self._column_attributes(column),
+                type=self.get_csharp_type(column),
+                name=self.to_pascal_case(column.name)
+            )
+            for column in columns
+        ]
         
-        if any([self.attribute_config.use_key, self.attribute_config.use_required,
-                self.attribute_config.use_maxlength]):
-            using_statements.add("using System.ComponentModel.DataAnnotations;")
+        return CLASS_TEMPLATE.format(
+            usings=self._usings_header,
+            namespace=self._ns_open,
+            table_attribute=table_attribute,
+            name=self.to_pascal_case(table_name),
+            properties="".join(properties)
+        )
+    
+    def _column_attributes(self, column: ColumnInfo) -> str:
+        """Build the attribute lines that precede a property
         
-        if any([self.attribute_config.use_column, self.attribute_config.use_table,
-                self.attribute_config.use_database_generated]):
-            using_statements.add("using System.ComponentModel.DataAnnotations.Schema;")
+        Each check tests the configuration flag first, so a disabled attribute
+        short-circuits without reading the column.
+        """
+        attribute_config = self.attribute_config
+        attributes = ""
         
-        lines = list(sorted(using_statements))
-        lines.extend(["", f"namespace {self.config['Generator']['namespace']}", "{"])
+        # Add Key attribute
+        if attribute_config.use_key and column.is_primary_key:
+            attributes += KEY_ATTRIBUTE
         
-        # Add table attribute if configured
-        if self.attribute_config.use_table:
-            lines.append(f'    [Table("{table_name}")]')
+        # Add DatabaseGenerated attribute
+        if attribute_config.use_database_generated and column.is_auto_increment:
+            attributes += DATABASE_GENERATED_ATTRIBUTE
         
-        lines.extend([
-            f"    public class {class_name}",
-            "    {"
-        ])
+        # Add Column attribute
+        if attribute_config.use_column:
+            attributes += f'        [Column("{column.name}")]\n'
         
-        # Add properties
-        for column in columns:
-            attributes = []
-            
-            # Add Key attribute
-            if column.is_primary_key and self.attribute_config.use_key:
-                attributes.append("        [Key]")
-            
-            # Add DatabaseGenerated attribute
-            if column.is_auto_increment and self.attribute_config.use_database_generated:
-                attributes.append("        [DatabaseGenerated(DatabaseGeneratedOption.Identity)]")
-            
-            # Add Column attribute
-            if self.attribute_config.use_column:
-                attributes.append(f'        [Column("{column.name}")]')
-            
-            # Add Required attribute
-            if not column.is_nullable and column.data_type != "string" and self.attribute_config.use_required:
-                attributes.append("        [Required]")
-            
-            # Add MaxLength for string fields
-            if (column.max_length and column.data_type in ['varchar', 'char'] 
-                and self.attribute_config.use_maxlength):
-                attributes.append(f"        [MaxLength({column.max_length})]")
-            
-            # Add attributes if any
-            if attributes:
-                lines.extend(attributes)
-            
-            # Add property
-            property_type = self.get_csharp_type(column)
-            property_name = self.to_pascal_case(column.name)
-            lines.append(f"        public {property_type} {property_name} {{ get; set; }}")
-            lines.append("")
+        # Add Required attribute
+        if attribute_config.use_required and not column.is_nullable and column.data_type != "string":
+            attributes += REQUIRED_ATTRIBUTE
         
-        # Close class and namespace
-        lines.extend(["    }", "}"])
+        # Add MaxLength for string fields
+        if (attribute_config.use_maxlength and column.max_length
+                and column.data_type in MAXLENGTH_TYPES):
+            attributes += f"        [MaxLength({column.max_length})]\n"
         
-        return "\n".join(lines)
+        return attributes
     
-    def to_pascal_case(self, snake_str: str) -> str:
-        """Convert snake_case to PascalCase"""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def to_pascal_case(snake_str: str) -> str:
+        """Convert snake_case to PascalCase
+        
+        Each word is title-cased, so generated names match earlier releases:
+        
+        >>> EntityGenerator.to_pascal_case('user_accounts')
+        'UserAccounts'
+        >>> EntityGenerator.to_pascal_case('USER_ID')
+        'UserId'
+        >>> EntityGenerator.to_pascal_case('address2line')
+        'Address2Line'
+        >>> EntityGenerator.to_pascal_case('order_2nd')
+        'Order2Nd'
+        """
         return ''.join(word.title() for word in snake_str.split('_'))
     
     def get_csharp_type(self, column: ColumnInfo) -> str:
         """Map MySQL types to C# types with special handling for boolean fields"""
-        base_type = column.data_type.lower()
+        # DATA_TYPE is lower-cased when the column is read
+        base_type = column.data_type
         
         # Special handling for tinyint(1) which represents boolean in MySQL
         if base_type == 'tinyint' and column.max_length == 1:
-            return 'bool' if not column.is_nullable else 'bool?'
-            
-        type_mapping = {
-            'bit': 'bool',
-            'tinyint': 'byte',
-            'smallint': 'short',
-            'int': 'int',
-            'bigint': 'long',
-            'decimal': 'decimal',
-            'float': 'float',
-            'double': 'double',
-            'datetime': 'DateTime',
-            'date': 'DateTime',
-            'timestamp': 'DateTime',
-            'time': 'TimeSpan',
-            'char': 'string',
-            'varchar': 'string',
-            'text': 'string',
-            'longtext': 'string',
-            'json': 'string'
-        }
+            base_type = 'bit'
         
-        cs_type = type_mapping.get(base_type, 'object')
-        if column.is_nullable and cs_type != 'string':
-            return f"{cs_type}?"
-        return cs_type
+        if column.is_nullable:
+            return NULLABLE_TYPE_MAPPING.get(base_type, 'object?')
+        return TYPE_MAPPING.get(base_type, 'object')
 
-    async def get_columns(self, cursor, table_name: str) -> List[ColumnInfo]:
-        """Get column information for a table with enhanced type information"""
+    def get_all_columns(self, cursor) -> Dict[str, List[ColumnInfo]]:
+        """Get column information for every table in the database in a single query"""
         cursor.execute("""
             SELECT 
+                TABLE_NAME,
                 COLUMN_NAME,
                 DATA_TYPE,
                 IS_NULLABLE,
@@ -321,48 +643,64 @@ class EntityGenerator:
                 NUMERIC_SCALE,
                 COLUMN_TYPE  -- Added to get full type information including length
             FROM INFORMATION_SCHEMA.COLUMNS 
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-            ORDER BY ORDINAL_POSITION
-        """, (self.config['Database']['database'], table_name))
+            WHERE TABLE_SCHEMA = %s
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """, (self._db_name,))
         
-        columns = []
+        columns_by_table = defaultdict(list)
         for row in cursor.fetchall():
             # Extract length from COLUMN_TYPE for tinyint
-            column_type = row[8].lower()  # e.g., "tinyint(1)"
+            column_type = row[9].lower()  # e.g., "tinyint(1)"
             max_length = None
             
-            if "tinyint" in column_type:
+            if column_type.startswith('tinyint'):
                 # Extract the length from tinyint(n)
-                match = re.search(r'tinyint\((\d+)\)', column_type)
+                match = TINYINT_LENGTH_RE.match(column_type)
                 if match:
                     max_length = int(match.group(1))
             else:
-                max_length = row[5]  # Use CHARACTER_MAXIMUM_LENGTH for other types
+                max_length = row[6]  # Use CHARACTER_MAXIMUM_LENGTH for other types
             
-            columns.append(ColumnInfo(
-                name=row[0],
-                data_type=row[1],
-                is_nullable=row[2] == "YES",
-                is_primary_key=row[3] == "PRI",
-                is_auto_increment="auto_increment" in row[4],
+            columns_by_table[row[0]].append(ColumnInfo(
+                name=row[1],
+                data_type=row[2].lower(),  # Normalized once for get_csharp_type
+                is_nullable=row[3] == "YES",
+                is_primary_key=row[4] == "PRI",
+                is_auto_increment="auto_increment" in row[5],
                 max_length=max_length,
-                numeric_precision=row[6],
-                numeric_scale=row[7]
+                numeric_precision=row[7],
+                numeric_scale=row[8]
             ))
         
-        return columns
+        return columns_by_table
     
-    async def get_tables(self, cursor) -> List[str]:
+    def get_tables(self, cursor) -> List[str]:
         """Get all tables from the database"""
         cursor.execute("""
             SELECT TABLE_NAME 
             FROM INFORMATION_SCHEMA.TABLES 
             WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE'
-        """, (self.config['Database']['database'],))
+        """, (self._db_name,))
         
         return [row[0] for row in cursor.fetchall()]
     
 
+def _discard_log(msg: str, *args):
+    """Stand-in for Logger.info on generators with verbose disabled"""
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a MySQL identifier, escaping embedded backticks"""
+    return "`" + name.replace("`", "``") + "`"
+
+
+def write_text_file(output: Tuple[str, str]) -> str:
+    """Write (file_path, content) as UTF-8 and return the file path"""
+    file_path, content = output
+    Path(file_path).write_text(content, encoding='utf-8')
+    return file_path
+
+
 def create_default_config(file_path: str):
     """Create a default configuration file"""
     config = configparser.ConfigParser()
@@ -389,11 +727,14 @@ def create_default_config(file_path: str):
         'use_databasegenerated_attribute': 'true'
     }
     
-    with open(file_path, 'w') as config_file:
+    with open(file_path, 'w', encoding=CONFIG_ENCODING) as config_file:
         config.write(config_file)
 
 
 def main():
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    logging.getLogger('entitygen').setLevel(logging.INFO)
+    
     print("Database Entity Generator")
     print("------------------------")
     
@@ -415,8 +756,7 @@ def main():
         generator = EntityGenerator(config_file)
         
         # Run generator
-        import asyncio
-        asyncio.run(generator.generate_entities())
+        generator.generate_entities()
         
     except ConfigurationError as e:
         print(f"Configuration error: {e}")